@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import inspect
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from upath import UPath
 import yaml
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 
-class FuncInfo(TypedDict):
+class FuncInfo(NamedTuple):
     fn: str
     description: str
     examples: example.ExampleList
@@ -28,7 +28,7 @@ def inspect_function(func: Callable[..., Any]) -> FuncInfo:
         func: The function to inspect
 
     Returns:
-        Dictionary containing function info, description and examples
+        FuncInfo tuple containing import path, description and examples
 
     Examples:
         >>> def example_func(x: int) -> str:
@@ -40,7 +40,7 @@ def inspect_function(func: Callable[..., Any]) -> FuncInfo:
         ...     '''
         ...     return f"Number: {x}"
         >>> result = inspect_function(example_func)
-        >>> result['description']
+        >>> result.description
         'Format a number.'
     """
     if not callable(func):
@@ -65,22 +65,20 @@ def inspect_function(func: Callable[..., Any]) -> FuncInfo:
     style = docstringstyler.detect_docstring_style(docstring)
     doc = docstringstyler.parse_docstring(docstring, style=style.value)
 
-    # Initialize result dictionary
-    result: FuncInfo = {"fn": full_path, "description": "", "examples": []}
-
     # Extract description and examples
+    description = ""
+    examples: example.ExampleList = []
     for section in doc:
         match section.kind:
             case "text":
-                result["description"] = section.value.strip()
+                description = section.value.strip()
             case "examples":
-                examples = [
+                examples.extend(
                     example.Example(template=str(ex).strip())
                     for ex in section.value
                     if str(ex).strip()
-                ]
-                result["examples"].extend(examples)
-    return result
+                )
+    return FuncInfo(fn=full_path, description=description, examples=examples)
 
 
 def generate_function_docs(
@@ -114,13 +112,14 @@ def generate_function_docs(
 
     if output_path:
         path = UPath(output_path)
+        data = {name: info._asdict() for name, info in result.items()}
         match path.suffix.lower():
             case ".yaml" | ".yml":
-                path.write_text(yaml.dump(result, sort_keys=False))
+                path.write_text(yaml.dump(data, sort_keys=False))
             case ".json":
                 import json
 
-                path.write_text(json.dumps(result, indent=2))
+                path.write_text(json.dumps(data, indent=2))
             case _:
                 msg = "Unsupported output format. Use .yaml, .yml, or .json"
                 raise ValueError(msg)
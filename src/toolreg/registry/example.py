@@ -1,22 +1,23 @@
 from __future__ import annotations
 
+import dataclasses
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
 
-
-class Example(BaseModel):
+@dataclasses.dataclass(slots=True, frozen=True)
+class Example:
     """Example model for jinja items."""
 
-    # content: str = Field(description="Template content to render")
-    template: str = Field(description="The input string or expression for the example")
-    title: str = Field(default="", description="Title of the example")
-    description: str | None = Field(default=None, description="Example description")
-    markdown: bool = Field(default=False, description="Whether content is markdown")
-    language: Literal["jinja", "python"] = Field(
-        default="jinja",
-        description="The language of the example (jinja or python)",
-    )
+    template: str
+    """The input string or expression for the example"""
+    title: str = ""
+    """Title of the example"""
+    description: str | None = None
+    """Example description"""
+    markdown: bool = False
+    """Whether content is markdown"""
+    language: Literal["jinja", "python"] = "jinja"
+    """The language of the example (jinja or python)"""
 
 
 ExampleList = list[Example]
@@ -27,7 +27,7 @@ import tomli
 from upath import UPath
 
 from toolreg.registry import registry, tool
-from toolreg.utils import resolve
+from toolreg.utils import resolve, upath_read
 
 
 if TYPE_CHECKING:
@@ -110,7 +110,7 @@ class ToolLoader:
             ])
             ```
         """
-        upaths = [UPath(p) for p in paths]
+        upaths = [p if isinstance(p, UPath) else UPath(p) for p in paths]
         pattern = "**/*.toml" if recursive else "*.toml"
 
         for path in upaths:
@@ -140,7 +140,7 @@ class ToolLoader:
             prevent other tools in the same file from being loaded.
         """
         try:
-            content = tomli.loads(path.read_text(encoding="utf-8"))
+            content = tomli.loads(upath_read.read_bytes(path).decode("utf-8"))
         except Exception as exc:
             msg = f"Failed to load {path}: {exc}"
             raise ToolLoadError(msg) from exc
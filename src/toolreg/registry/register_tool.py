@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import functools
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -118,7 +117,7 @@ def register_tool(
         description: Optional override for function description
 
     Returns:
-        Decorator function that preserves the original function while registering it
+        Decorator function that registers the function and returns it unchanged
 
     Example:
         ```python
@@ -152,12 +151,7 @@ def register_tool(
             icon=icon,
             description=description,
         )
-
-        @functools.wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            return func(*args, **kwargs)
-
-        return wrapper
+        return func
 
     return decorator
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+import sys
 from typing import TYPE_CHECKING, Any, Literal
 
 
@@ -28,10 +29,12 @@ class ToolRegistry:
 
     def register(self, func: FilterFunc, metadata: tool.Tool) -> None:
         """Register a new item with metadata."""
-        self._items[metadata.name] = (func, metadata)
+        items = self._items
+        value = (func, metadata)
+        items[metadata.name] = value
         # Also register aliases
         for alias in metadata.aliases:
-            self._items[alias] = (func, metadata)
+            items[sys.intern(alias)] = value
 
     def get_all(
         self,
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import dataclasses
 from datetime import datetime
+import functools
 import logging
-from typing import TYPE_CHECKING, Any, Protocol, TypedDict, TypeVar
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field
 import upath
 
 
@@ -23,15 +26,8 @@ type FunctionArgs = tuple[Any, ...]
 type FunctionKwargs = dict[str, Any]
 
 
-class ErrorContext(TypedDict):
-    """Type definition for error context information."""
-
-    function: str
-    args: FunctionArgs
-    kwargs: FunctionKwargs
-
-
-class ExecutionContext(BaseModel):
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class ExecutionContext:
     """Immutable execution context containing function execution details.
 
     Attributes:
@@ -53,14 +49,12 @@ class ExecutionContext(BaseModel):
         ```
     """
 
-    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
-
-    function_name: str = Field(..., description="Name of the executed function")
-    args: FunctionArgs = Field(default_factory=tuple, description="Positional arguments")
-    kwargs: FunctionKwargs = Field(default_factory=dict, description="Keyword arguments")
-    start_time: datetime = Field(..., description="Execution start timestamp")
-    result: Any | None = Field(None, description="Function execution result")
-    error: Exception | None = Field(None, description="Exception if execution failed")
+    function_name: str
+    args: FunctionArgs = ()
+    kwargs: FunctionKwargs = dataclasses.field(default_factory=dict)
+    start_time: datetime
+    result: Any | None = None
+    error: Exception | None = None
 
 
 class RegistryEvents(Protocol):
@@ -122,16 +116,16 @@ class RegistryEvents(Protocol):
             succeeded or failed.
         """
 
-    def on_error(self, error: Exception, context: ErrorContext) -> None:
+    def on_error(self, error: Exception, context: ExecutionContext) -> None:
         """Handle error events.
 
         Args:
             error: Exception that occurred
-            context: Error context information
+            context: Execution context of the failed call
 
         Info:
-            The context dictionary contains function name, arguments, and any
-            additional information relevant to the error.
+            The context contains function name, arguments, start time and the
+            raised exception.
         """
 
 
@@ -188,7 +182,7 @@ class BaseRegistryEvents(ABC):
         """Handle post-execution events."""
 
     @abstractmethod
-    def on_error(self, error: Exception, context: dict[str, Any]) -> None:
+    def on_error(self, error: Exception, context: ExecutionContext) -> None:
         """Handle error events."""
 
 
@@ -221,8 +215,8 @@ class MetricsRegistryEvents(BaseRegistryEvents):
         status = "error" if context.error else "success"
         logger.debug("Completed %s with %s in %.2fs", name, status, duration)
 
-    def on_error(self, error: Exception, context: dict[str, Any]) -> None:
-        name = context["function"]
+    def on_error(self, error: Exception, context: ExecutionContext) -> None:
+        name = context.function_name
         self.error_count[name] = self.error_count.get(name, 0) + 1
         logger.error("Error in %s: %s", name, error)
 
@@ -270,8 +264,8 @@ class LoggingRegistryEvents(BaseRegistryEvents):
             f"in {duration:.2f}s: result={context.result}"
         )
 
-    def on_error(self, error: Exception, context: dict[str, Any]) -> None:
-        self._log(f"Error in {context['function']}: {error}")
+    def on_error(self, error: Exception, context: ExecutionContext) -> None:
+        self._log(f"Error in {context.function_name}: {error}")
 
 
 class CompositeEvents(BaseRegistryEvents):
@@ -294,7 +288,7 @@ class CompositeEvents(BaseRegistryEvents):
         for handler in self.handlers:
             handler.post_execute(context, duration, end_time)
 
-    def on_error(self, error: Exception, context: dict[str, Any]) -> None:
+    def on_error(self, error: Exception, context: ExecutionContext) -> None:
         for handler in self.handlers:
             handler.on_error(error, context)
 
@@ -324,6 +318,13 @@ def wrap_function(func: Callable[..., T], events: BaseRegistryEvents) -> Callabl
     Note:
         The wrapper maintains the original function's return type and signature.
     """
+    # Bind handlers and helpers once so the wrapper avoids per-call lookups
+    pre = events.pre_execute
+    post = events.post_execute
+    on_err = events.on_error
+    datetime_now = datetime.now
+    perf_counter = time.perf_counter
+    func_name = sys.intern(func.__name__)
 
     def wrapper(*args: Any, **kwargs: Any) -> T:
         """Execute the wrapped function with event handling.
@@ -338,64 +339,81 @@ def wrap_function(func: Callable[..., T], events: BaseRegistryEvents) -> Callabl
         Raises:
             Exception: Any exception from the wrapped function
         """
+        start_time = datetime_now()
         context = ExecutionContext(
-            function_name=func.__name__,
+            function_name=func_name,
             args=args,
             kwargs=kwargs,
-            start_time=datetime.now(),
+            start_time=start_time,
             result=None,
             error=None,
         )
 
         # Pre-execution
-        events.pre_execute(context)
+        pre(context)
+        start = perf_counter()
 
         try:
             # Execute
             result = func(*args, **kwargs)
+            duration = perf_counter() - start
+            end_time = datetime_now()
             context = ExecutionContext(
-                function_name=func.__name__,
+                function_name=func_name,
                 args=args,
                 kwargs=kwargs,
-                start_time=context.start_time,
+                start_time=start_time,
                 result=result,
                 error=None,
             )
 
-            # Calculate duration
-            end_time = datetime.now()
-            duration = (end_time - context.start_time).total_seconds()
-
             # Post-execution
-            events.post_execute(context, duration, end_time)
+            post(context, duration, end_time)
         except Exception as e:
             # Handle error
+            duration = perf_counter() - start
+            end_time = datetime_now()
             context = ExecutionContext(
-                function_name=func.__name__,
+                function_name=func_name,
                 args=args,
                 kwargs=kwargs,
-                start_time=context.start_time,
+                start_time=start_time,
                 error=e,
                 result=None,
             )
-
-            end_time = datetime.now()
-            duration = (end_time - context.start_time).total_seconds()
-
-            error_ctx = {
-                "function": func.__name__,
-                "args": args,
-                "kwargs": kwargs,
-            }
-            events.on_error(e, error_ctx)
-            events.post_execute(context, duration, end_time)
+            on_err(e, context)
+            post(context, duration, end_time)
             raise
         else:
             return result
 
+    # Minimal metadata copy instead of functools.wraps
+    wrapper.__name__ = func_name
+    wrapper.__wrapped__ = func  # type: ignore[attr-defined]
     return wrapper
 
 
+DEFAULT_LOG_FILE = "function_calls.log"
+
+
+@functools.cache
+def get_default_metrics() -> MetricsRegistryEvents:
+    """Return the metrics handler shared by all `register_tool` decorations."""
+    return MetricsRegistryEvents()
+
+
+@functools.cache
+def get_default_logger() -> LoggingRegistryEvents:
+    """Return the logging handler shared by all `register_tool` decorations."""
+    return LoggingRegistryEvents(DEFAULT_LOG_FILE)
+
+
+@functools.cache
+def get_default_events() -> CompositeEvents:
+    """Return the composite event handler shared by all `register_tool` decorations."""
+    return CompositeEvents([get_default_metrics(), get_default_logger()])
+
+
 def register_tool(**metadata: Any) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """Decorator to register a tool with event handling.
 
@@ -415,17 +433,15 @@ def register_tool(**metadata: Any) -> Callable[[Callable[..., T]], Callable[...,
         ```
 
     Note:
-        The decorator automatically sets up both metrics and logging handlers.
+        All decorated functions share the handlers returned by
+        `get_default_events`, so metrics can be compared across functions.
 
     Warning:
         The logging handler writes to "function_calls.log" by default.
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        # Create event handlers
-        metrics = MetricsRegistryEvents()
-        logging_handler = LoggingRegistryEvents("function_calls.log")
-        events = CompositeEvents([metrics, logging_handler])
+        events = get_default_events()
 
         # Register
         events.on_register(func, metadata)
@@ -439,28 +455,12 @@ def register_tool(**metadata: Any) -> Callable[[Callable[..., T]], Callable[...,
 if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
 
-    # Create shared event handlers that we'll use for all functions
-    metrics_handler = MetricsRegistryEvents()
-    logging_handler = LoggingRegistryEvents("function_calls.log")
-    shared_events = CompositeEvents([metrics_handler, logging_handler])
-
-    def register_tool_with_events(
-        **metadata: Any,
-    ) -> Callable[[Callable[..., T]], Callable[..., T]]:
-        """Create a tool registration decorator using shared event handlers."""
-
-        def decorator(func: Callable[..., T]) -> Callable[..., T]:
-            shared_events.on_register(func, metadata)
-            return wrap_function(func, shared_events)
-
-        return decorator
-
-    @register_tool_with_events(name="add", group="math")
+    @register_tool(name="add", group="math")
     def add(a: int, b: int) -> int:
         """Add two numbers."""
         return a + b
 
-    @register_tool_with_events(name="divide", group="math")
+    @register_tool(name="divide", group="math")
     def divide(a: float, b: float) -> float:
         """Divide two numbers."""
         return a / b
@@ -476,5 +476,6 @@ if __name__ == "__main__":
         print("Caught expected division error")
 
     # Show metrics using the shared metrics handler
+    metrics_handler = get_default_metrics()
     print("\nMetrics for add:", metrics_handler.get_metrics("add"))
     print("Metrics for divide:", metrics_handler.get_metrics("divide"))
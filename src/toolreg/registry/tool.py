@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import functools
+import sys
 from typing import TYPE_CHECKING, Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 from toolreg.dissect import inspect_function
 from toolreg.registry import example, registry
@@ -15,9 +17,22 @@ if TYPE_CHECKING:
     from toolreg.registry.registry import FilterFunc
 
 
+# Built once, used to validate caller-supplied values in a single call
+_EXAMPLES_ADAPTER = TypeAdapter(example.ExampleList)
+_NAME_ADAPTER = TypeAdapter(slugfield.Slug)
+_TYP_ADAPTER = TypeAdapter(registry.ItemType)
+
+
 class Tool(BaseModel):
     """Metadata for a jinja item."""
 
+    model_config = ConfigDict(
+        revalidate_instances="never",
+        validate_assignment=False,
+        extra="ignore",
+        ignored_types=(functools.cached_property,),
+    )
+
     name: slugfield.Slug
     """ame of the jinja item"""
     typ: registry.ItemType
@@ -37,6 +52,12 @@ class Tool(BaseModel):
     icon: str | None = None
     """ptional icon identifier"""
 
+    @field_validator("typ", "group")
+    @classmethod
+    def _intern(cls, value: str) -> str:
+        """Intern the small set of recurring type / group names."""
+        return sys.intern(value)
+
     @classmethod
     def from_function(
         cls,
@@ -87,33 +108,42 @@ class Tool(BaseModel):
         # Get base metadata from inspect_function
         extracted = inspect_function.inspect_function(func)
 
-        # Convert examples to Example model instances
+        # inspect_function output is trusted, so skip validation for it.
         extracted_examples = [
-            example.Example.model_validate(ex) for ex in extracted.get("examples", [])
+            example.Example(**ex) if isinstance(ex, dict) else ex
+            for ex in extracted.examples
         ]
 
-        # If examples provided in kwargs, use those instead
-        final_examples = examples if examples is not None else extracted_examples
-        # Build metadata dict with explicit precedence
-        metadata = {
-            "name": name if name is not None else func.__name__,
-            "typ": typ,
-            "import_path": extracted["fn"],
+        # If examples provided in kwargs, use those instead (untrusted, validate)
+        final_examples = (
+            _EXAMPLES_ADAPTER.validate_python(examples)
+            if examples is not None
+            else extracted_examples
+        )
+        # Build metadata dict in field order. An empty description is a valid
+        # override, so only that one keeps the explicit None check.
+        metadata: dict[str, Any] = {
+            # Lowercases the name, like validating the Slug field would.
+            "name": _NAME_ADAPTER.validate_python(name or func.__name__),
+            "typ": sys.intern(_TYP_ADAPTER.validate_python(typ)),
+            "import_path": extracted.fn,
             "description": (
-                description if description is not None else extracted.get("description")
+                description if description is not None else extracted.description
             ),
+            "group": sys.intern(group or "general"),
             "examples": final_examples,
-            "group": group if group is not None else "general",
-            "required_packages": required_packages
-            if required_packages is not None
-            else [],
-            "aliases": aliases if aliases is not None else [],
+            "required_packages": required_packages or [],
+            "aliases": aliases or [],
             "icon": icon,
         }
-
-        return cls.model_validate(metadata)
-
-    @property
+        # All values are either trusted or validated above, skip re-validation.
+        tool = cls.model_construct(**metadata)
+        # Seed the cached filter_fn with the registered callable. Resolving the
+        # import path here would fail, the module is still being imported.
+        tool.__dict__["filter_fn"] = func
+        return tool
+
+    @functools.cached_property
     def filter_fn(self) -> Callable[..., Any]:
         """Return the callable to use as filter / test / function."""
         try:
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import collections
 import contextlib
 import functools
+import importlib
 import inspect
 import logging
 import types
 from typing import TYPE_CHECKING, Any, TypeVar
+import weakref
 
 from upath import UPath
 
@@ -23,6 +26,9 @@ logger = logging.getLogger(__name__)
 
 ClassType = TypeVar("ClassType", bound=type)
 
+# Upper bound for the per-function LRU caches below
+CACHE_SIZE = 512
+
 HasCodeType = (
     types.ModuleType
     | type
@@ -34,6 +40,53 @@ HasCodeType = (
     | types.BuiltinFunctionType
 )
 
+type _FilterKey = tuple[bool, bool, bool, bool]
+
+# Classes are held weakly so that dynamically created ones can be collected.
+_BASECLASS_CACHE: weakref.WeakKeyDictionary[type, dict[_FilterKey, list[type]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# Rarely needed modules, mapped to their import path
+_LAZY_MODULES: dict[str, str] = {"mkdown": "toolreg.tools.mkdown"}
+
+
+def __getattr__(name: str) -> Any:
+    """Import rarely needed modules on first access and bind them as globals."""
+    try:
+        module_name = _LAZY_MODULES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    module = globals()[name] = importlib.import_module(module_name)
+    return module
+
+
+def _lazy(name: str) -> Any:
+    """Return a lazily imported global, importing it via `__getattr__` if needed."""
+    return globals().get(name) or __getattr__(name)
+
+
+def _class_filter(
+    filter_abstract: bool, filter_generic: bool, filter_locals: bool
+) -> Callable[[type], bool]:
+    """Build a predicate telling whether a class passes the given filters.
+
+    Checks are ordered cheapest-first, `inspect.isabstract` comes last.
+    """
+    isabstract = inspect.isabstract
+
+    def keep(cls: type) -> bool:
+        qualname = cls.__qualname__
+        if filter_generic and qualname[-1:] == "]":
+            return False
+        if filter_locals and "<locals>" in qualname:
+            return False
+        return not (filter_abstract and isabstract(cls))
+
+    return keep
+
 
 @register_tool(
     typ="filter",
@@ -41,7 +94,6 @@ HasCodeType = (
     icon="mdi:family-tree",
     examples=[Example(title="basic", template="""{{ list | list_subclasses }}""")],
 )
-@functools.cache
 def list_subclasses(
     klass: type,
     *,
@@ -52,6 +104,8 @@ def list_subclasses(
 ) -> list[type]:
     """Return list of all subclasses of given class.
 
+    The result is not cached, see `iter_subclasses`.
+
     Args:
         klass: class to get subclasses from
         recursive: whether to also get subclasses of subclasses
@@ -80,6 +134,8 @@ def iter_subclasses(
 ) -> Iterator[type]:
     """Iterate all subclasses of given class.
 
+    Not cached, subclasses can get added anywhere in the hierarchy at any time.
+
     Args:
         klass: class to get subclasses from
         recursive: whether to also get subclasses of subclasses
@@ -87,23 +143,22 @@ def iter_subclasses(
         filter_generic: whether generic base classes should be included
         filter_locals: whether local base classes should be included
     """
-    if getattr(klass.__subclasses__, "__self__", None) is None:
-        return
-    for cls in klass.__subclasses__():
-        if recursive:
-            yield from iter_subclasses(
-                cls,
-                filter_abstract=filter_abstract,
-                filter_generic=filter_generic,
-                filter_locals=filter_locals,
-            )
-        if filter_abstract and inspect.isabstract(cls):
+    keep = _class_filter(filter_abstract, filter_generic, filter_locals)
+    seen: set[int] = set()
+    queue = collections.deque([klass])
+    while queue:
+        current = queue.popleft()
+        if getattr(current.__subclasses__, "__self__", None) is None:
             continue
-        if filter_generic and cls.__qualname__.endswith("]"):
-            continue
-        if filter_locals and "<locals>" in cls.__qualname__:
-            continue
-        yield cls
+        subclasses: list[type] = current.__subclasses__()
+        for cls in subclasses:
+            if id(cls) in seen:
+                continue
+            seen.add(id(cls))
+            if recursive:
+                queue.append(cls)
+            if keep(cls):
+                yield cls
 
 
 @register_tool(
@@ -112,7 +167,6 @@ def iter_subclasses(
     icon="mdi:family-tree",
     examples=[Example(title="basic", template="""{{ zip | list_baseclasses }}""")],
 )
-@functools.cache
 def list_baseclasses(
     klass: type,
     *,
@@ -130,15 +184,19 @@ def list_baseclasses(
         filter_generic: whether generic base classes should be included
         filter_locals: whether local base classes should be included
     """
-    return list(
-        iter_baseclasses(
-            klass,
-            recursive=recursive,
-            filter_abstract=filter_abstract,
-            filter_generic=filter_generic,
-            filter_locals=filter_locals,
-        ),
-    )
+    key = (recursive, filter_abstract, filter_generic, filter_locals)
+    entries = _BASECLASS_CACHE.setdefault(klass, {})
+    if (result := entries.get(key)) is None:
+        result = entries[key] = list(
+            iter_baseclasses(
+                klass,
+                recursive=recursive,
+                filter_abstract=filter_abstract,
+                filter_generic=filter_generic,
+                filter_locals=filter_locals,
+            ),
+        )
+    return list(result)
 
 
 def iter_baseclasses(
@@ -158,22 +216,18 @@ def iter_baseclasses(
         filter_generic: whether generic base classes should be included
         filter_locals: whether local base classes should be included
     """
-    for cls in klass.__bases__:
-        if recursive:
-            yield from iter_baseclasses(
-                cls,
-                recursive=recursive,
-                filter_abstract=filter_abstract,
-                filter_generic=filter_generic,
-                filter_locals=filter_locals,
-            )
-        if filter_abstract and inspect.isabstract(cls):
-            continue
-        if filter_generic and cls.__qualname__.endswith("]"):
-            continue
-        if filter_locals and "<locals>" in cls.__qualname__:
-            continue
-        yield cls
+    keep = _class_filter(filter_abstract, filter_generic, filter_locals)
+    seen: set[int] = set()
+    queue = collections.deque([klass])
+    while queue:
+        for cls in queue.popleft().__bases__:
+            if id(cls) in seen:
+                continue
+            seen.add(id(cls))
+            if recursive:
+                queue.append(cls)
+            if keep(cls):
+                yield cls
 
 
 @register_tool(
@@ -182,7 +236,7 @@ def iter_baseclasses(
     icon="mdi:file-document",
     examples=[Example(title="basic", template="""{{ filters.get_doc | get_doc }}""")],
 )
-@functools.cache
+@functools.lru_cache(maxsize=CACHE_SIZE)
 def get_doc(
     obj: Any,
     *,
@@ -202,22 +256,39 @@ def get_doc(
         only_summary: Only return first line of docstrings
         only_description: Only return block after first line
     """
-    from toolreg.tools import mkdown
-
-    match obj:
-        case _ if from_base_classes:
-            doc = inspect.getdoc(obj)
-        case _ if obj.__doc__:
-            doc = inspect.cleandoc(obj.__doc__)
-        case _:
-            doc = None
+    if from_base_classes:
+        doc = inspect.getdoc(obj)
+    elif obj.__doc__:
+        doc = inspect.cleandoc(obj.__doc__)
+    else:
+        doc = None
     if not doc:
         return fallback
     if only_summary:
         doc = doc.split("\n")[0]
     if only_description:
         doc = "\n".join(doc.split("\n")[1:])
-    return mkdown.md_escape(doc) if doc and escape else doc
+    return _lazy("mkdown").md_escape(doc) if doc and escape else doc
+
+
+def _function_argspec(obj: Any, remove_self: bool) -> inspect.FullArgSpec:
+    return inspect.getfullargspec(obj)
+
+
+def _bound_argspec(obj: Any, remove_self: bool) -> inspect.FullArgSpec:
+    argspec = inspect.getfullargspec(obj)
+    if remove_self:
+        del argspec.args[0]
+    return argspec
+
+
+# Exact-type fast path for get_argspec, subclasses use the isinstance chain
+_ARGSPEC_HANDLERS: dict[type, Callable[[Any, bool], inspect.FullArgSpec]] = {
+    types.FunctionType: _function_argspec,
+    types.MethodType: _bound_argspec,
+    types.BuiltinFunctionType: _bound_argspec,
+    types.BuiltinMethodType: _bound_argspec,
+}
 
 
 @register_tool(
@@ -237,6 +308,8 @@ def get_argspec(obj: Any, remove_self: bool = True) -> inspect.FullArgSpec:
         obj: A callable python object
         remove_self: Whether to remove "self" argument from method argspecs
     """
+    if (handler := _ARGSPEC_HANDLERS.get(type(obj))) is not None:
+        return handler(obj, remove_self)
     if inspect.isfunction(obj):
         argspec = inspect.getfullargspec(obj)
     elif inspect.ismethod(obj):
@@ -283,7 +356,7 @@ def get_deprecated_message(obj: Any) -> str | None:
         Example(title="basic", template="""{{ filters.get_source | get_source }}""")
     ],
 )
-@functools.cache
+@functools.lru_cache(maxsize=CACHE_SIZE)
 def get_source(obj: HasCodeType) -> str:
     """Get source code for given object.
 
@@ -304,7 +377,7 @@ def get_source(obj: HasCodeType) -> str:
         )
     ],
 )
-@functools.cache
+@functools.lru_cache(maxsize=CACHE_SIZE)
 def get_source_lines(obj: HasCodeType) -> tuple[list[str], int]:
     """Get source lines for given object.
 
@@ -320,7 +393,7 @@ def get_source_lines(obj: HasCodeType) -> tuple[list[str], int]:
     icon="mdi:function",
     examples=[],
 )
-@functools.cache
+@functools.lru_cache(maxsize=CACHE_SIZE)
 def get_signature(obj: Any) -> inspect.Signature:
     """Get signature for given callable.
 
@@ -336,18 +409,28 @@ def get_signature(obj: Any) -> inspect.Signature:
     icon="mdi:file-find",
     examples=[Example(title="basic", template="""{{ filters.get_file | get_file }}""")],
 )
-@functools.cache
 def get_members(obj: object, predicate: Callable[[Any], bool] | None = None):
     """Cached version of inspect.getmembers.
 
+    Unhashable objects are inspected without caching.
+
     Args:
         obj: Object to get members for
         predicate: Optional predicate for the members
     """
+    try:
+        hash((obj, predicate))
+    except TypeError:
+        return inspect.getmembers(obj, predicate)
+    return _get_members_cached(obj, predicate)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _get_members_cached(obj: object, predicate: Callable[[Any], bool] | None):
     return inspect.getmembers(obj, predicate)
 
 
-@functools.cache
+@functools.lru_cache(maxsize=CACHE_SIZE)
 def get_file(obj: HasCodeType) -> UPath | None:
     """Cached wrapper for inspect.getfile.
 
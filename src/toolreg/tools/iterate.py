@@ -1,18 +1,24 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Iterable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
+import functools
 import itertools
 import operator
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from toolreg.registry.example import Example
 from toolreg.registry.register_tool import register_tool
 
 
+if TYPE_CHECKING:
+    import types
+
+
 T = TypeVar("T")
 
 
-@register_tool(
+# itertools.pairwise is registered as-is, a wrapper would only add a Python frame.
+pairwise = register_tool(
     typ="filter",
     group="iter",
     icon="mdi:compare",
@@ -24,16 +30,7 @@ T = TypeVar("T")
 {% endfor %}""",
         )
     ],
-)
-def pairwise(items: Iterable[T]) -> itertools.pairwise[tuple[T, T]]:
-    """Return an iterator of overlapping pairs taken from the input iterator.
-
-    s -> (s0,s1), (s1,s2), (s2, s3), ...
-
-    Args:
-        items: The items to iter pair-wise
-    """
-    return itertools.pairwise(items)
+)(itertools.pairwise)
 
 
 @register_tool(
@@ -256,10 +253,25 @@ def do_zip(*items: Iterable[T]) -> zip[tuple[T, ...]]:
 def reduce_list(items: Iterable[T]) -> list[T]:
     """Reduce duplicate items in a list and preserve order.
 
+    Unhashable items are supported as well, they get compared by equality.
+
     Args:
         items: The iterable to recude to a unique-item list
     """
-    return list(dict.fromkeys(items))
+    seen: set[Any] = set()
+    mark = seen.add
+    result: list[T] = []
+    add = result.append
+    for item in items:
+        try:
+            if item in seen:
+                continue
+            mark(item)
+        except TypeError:
+            if item in result:
+                continue
+        add(item)
+    return result
 
 
 @register_tool(
@@ -273,7 +285,7 @@ def reduce_list(items: Iterable[T]) -> list[T]:
         )
     ],
 )
-def flatten_dict(dct: Mapping, sep: str = "/", _parent_key: str = "") -> Mapping:
+def flatten_dict(dct: Mapping, sep: str = "/") -> Mapping:
     """Flatten a nested dictionary to a flat one.
 
     The individual parts of the "key path" are joined with given separator.
@@ -281,17 +293,23 @@ def flatten_dict(dct: Mapping, sep: str = "/", _parent_key: str = "") -> Mapping
     Args:
         dct: The dictionary to flatten
         sep: The separator to use for joining
-        _parent_key: Internal parameter for recursive calls
     """
-    items: list[tuple[str, str]] = []
-    for k, v in dct.items():
-        new_key = _parent_key + sep + k if _parent_key else k
-        if isinstance(v, Mapping):
-            flattened = flatten_dict(v, _parent_key=new_key, sep=sep)
-            items.extend(flattened.items())
+    return dict(_walk_items(dct, sep))
+
+
+def _walk_items(dct: Mapping, sep: str) -> Iterator[tuple[Any, Any]]:
+    """Yield (key path, value) pairs of a nested mapping depth-first."""
+    stack: list[tuple[Iterator[tuple[Any, Any]], str]] = [(iter(dct.items()), "")]
+    while stack:
+        items, prefix = stack[-1]
+        for k, v in items:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            if isinstance(v, Mapping):
+                stack.append((iter(v.items()), new_key))
+                break
+            yield new_key, v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
 
 
 @register_tool(
@@ -307,11 +325,9 @@ def flatten_dict(dct: Mapping, sep: str = "/", _parent_key: str = "") -> Mapping
         )
     ],
 )
-def batched(iterable: Iterable[T], n: int) -> Generator[tuple[T, ...], None, None]:
+def batched(iterable: Iterable[T], n: int) -> itertools.batched[tuple[T, ...]]:
     """Batch data into tuples of length n. The last batch may be shorter.
 
-    Note: this function was added to Py3.12 itertools
-
     Examples:
         ``` py
         batched('ABCDEFG', 3)  # returns ABC DEF G
@@ -321,12 +337,7 @@ def batched(iterable: Iterable[T], n: int) -> Generator[tuple[T, ...], None, Non
         iterable: The iterable to yield as batches
         n: The batch size
     """
-    if n < 1:
-        msg = "n must be at least one"
-        raise ValueError(msg)
-    it = iter(iterable)
-    while batch := tuple(itertools.islice(it, n)):
-        yield batch
+    return itertools.batched(iterable, n)
 
 
 @register_tool(
@@ -357,13 +368,23 @@ def natsort(
         reverse: Whether to reverse the sort order
         ignore_case: Whether to ignore case for sorting
     """
-    from natsort import natsorted, ns
-
-    alg = ns.IGNORECASE
-    if not ignore_case:
-        alg = ns.LOWERCASEFIRST
     key_fn = operator.attrgetter(key) if isinstance(key, str) else key
-    return natsorted(val, key=key_fn, reverse=reverse, alg=alg)
+    return _get_natsort().natsorted(
+        val, key=key_fn, reverse=reverse, alg=_natsort_alg(ignore_case)
+    )
+
+
+@functools.cache
+def _get_natsort() -> types.ModuleType:
+    import natsort
+
+    return natsort
+
+
+@functools.cache
+def _natsort_alg(ignore_case: bool) -> Any:
+    ns = _get_natsort().ns
+    return ns.IGNORECASE if ignore_case else ns.LOWERCASEFIRST
 
 
 @register_tool(
@@ -397,22 +418,30 @@ def groupby(
         natural_sort: Whether to use a natural sort algorithm
         reverse: Whether to reverse the value list
     """
-    if key is None:
-
-        def keyfunc(x):
-            return x
-
-    elif isinstance(key, str):
-        keyfunc = operator.attrgetter(key)
-    else:
-        keyfunc = key
-    if sort_groups or natural_sort:
-        if natural_sort:
-            import natsort
-
-            data = natsort.natsorted(data, key=keyfunc)
+    keyfunc: Callable[[T], Any] | None = (
+        operator.attrgetter(key) if isinstance(key, str) else key
+    )
+    if sort_groups and not natural_sort and not reverse:
+        # Bucket in one pass and only sort the distinct keys.
+        buckets: dict[Any, list[T]] = {}
+        if keyfunc is None:
+            for item in data:
+                buckets.setdefault(item, []).append(item)
         else:
-            data = sorted(data, key=keyfunc)
+            for item in data:
+                buckets.setdefault(keyfunc(item), []).append(item)
+        return {k: buckets[k] for k in sorted(buckets)}
+    if sort_groups and not natural_sort:
+        # Decorate-sort-undecorate: compute each key once and reuse it for grouping.
+        items = list(data)
+        keys: list[Any] = items if keyfunc is None else [keyfunc(item) for item in items]
+        get_key = keys.__getitem__
+        order = sorted(range(len(items)), key=get_key)
+        if reverse:
+            order.reverse()
+        return {k: [items[i] for i in g] for k, g in itertools.groupby(order, get_key)}
+    if natural_sort:
+        data = _get_natsort().natsorted(data, key=keyfunc)
     if reverse:
         data = reversed(list(data))
     return {k: list(g) for k, g in itertools.groupby(data, keyfunc)}
@@ -472,7 +501,7 @@ def do_any(seq: Iterable[Any], attribute: str | None = None) -> bool:
     """
     if attribute is None:
         return any(seq)
-    return any(getattr(i, attribute) for i in seq)
+    return any(map(operator.attrgetter(attribute), seq))
 
 
 if __name__ == "__main__":
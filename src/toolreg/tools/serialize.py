@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import configparser
+import functools
 import io
 import json
 from typing import TYPE_CHECKING, Any, Literal
@@ -19,6 +20,8 @@ if TYPE_CHECKING:
 
 SerializeFormatStr = Literal["yaml", "json", "ini", "toml"]
 
+_MISSING = object()
+
 
 @register_tool(
     typ="filter",
@@ -49,10 +52,9 @@ def serialize(data: Any, fmt: SerializeFormatStr, **kwargs: Any) -> str:
         case "ini":
             config = configparser.ConfigParser(**kwargs)
             config.read_dict(data)
-            file = io.StringIO()
-            with file as fp:
-                config.write(fp)
-                return file.getvalue()
+            buf = io.StringIO()
+            config.write(buf)
+            return buf.getvalue()
         case "toml" if isinstance(data, dict):
             import tomli_w
 
@@ -153,16 +155,17 @@ def dig(
         keep_path: Return result with original nesting
         dig_yaml_lists: Also dig into single-key->value pairs, as in yaml
     """
+    dict_, list_ = dict, list
     for i in sections:
-        if isinstance(data, dict):
-            if child := data.get(i):
-                data = child
-            else:
+        if isinstance(data, dict_):
+            child = data.get(i, _MISSING)
+            if child is _MISSING:
                 return None
-        elif dig_yaml_lists and isinstance(data, list):
+            data = child
+        elif dig_yaml_lists and isinstance(data, list_):
             # this part is for yaml-style listitems
             for idx in data:
-                if i in idx and isinstance(idx, dict):
+                if i in idx and isinstance(idx, dict_):
                     data = idx[i]
                     break
                 if isinstance(idx, str) and idx == i:
@@ -172,12 +175,9 @@ def dig(
                 return None
     if not keep_path:
         return data
-    result: dict[str, dict] = {}
-    new = result
-    for sect in sections:
-        result[sect] = data if sect == sections[-1] else {}
-        result = result[sect]
-    return new
+    for sect in reversed(sections):
+        data = {sect: data}
+    return data
 
 
 @register_tool(
@@ -209,7 +209,12 @@ def merge(
 
     if deepcopy:
         target = copy.deepcopy(target)
-    context = deepmerge.DeepMerger(mergers)
+    context = _get_default_merger() if mergers is None else deepmerge.DeepMerger(mergers)
     for s in source:
         target = context.merge(s, target)
     return target
+
+
+@functools.cache
+def _get_default_merger() -> deepmerge.DeepMerger:
+    return deepmerge.DeepMerger(None)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import builtins
 import datetime
+import functools
 import inspect
 import math
 import os
@@ -177,12 +178,15 @@ def contains_files(directory: str | os.PathLike[str]) -> bool:
     return path.exists() and any(path.iterdir())
 
 
+@functools.lru_cache(maxsize=4096)
 def is_installed(package_name: str) -> bool:
     """Returns true if a package with given name is found.
 
     Args:
         package_name: The package name to check
     """
+    if package_name in sys.modules:
+        return True
     import importlib.util
 
     return bool(importlib.util.find_spec(package_name))
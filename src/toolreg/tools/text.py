@@ -6,7 +6,8 @@ import datetime
 import functools
 import inspect
 import itertools
-import re
+import string
+import time
 from typing import TYPE_CHECKING, Any
 
 from jinjarope import utils
@@ -19,8 +20,29 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     import os
 
+    from markupsafe import Markup
 
-CASE_PATTERN = re.compile(r"(?<!^)(?=[A-Z])")
+
+_markup_escape: Callable[[Any], Markup] | None
+try:
+    from markupsafe import escape as _markup_escape
+except ImportError:
+    _markup_escape = None
+
+
+# Codes which time.strftime either lacks or renders differently for naive datetimes
+_DATETIME_ONLY_CODES = ("%f", "%z", "%:z", "%Z")
+_SLUG_CHARS = frozenset(string.ascii_letters + string.digits + "_.")
+
+
+class _SlugTable(dict[int, str | int]):
+    """Translation table mapping every non-slug character to an underscore."""
+
+    def __missing__(self, key: int) -> str:
+        return "_"
+
+
+_SLUG_TABLE = _SlugTable({i: i if chr(i) in _SLUG_CHARS else "_" for i in range(128)})
 
 
 @register_tool(
@@ -113,8 +135,9 @@ def lower_camel_case(text: str) -> str:
     """
     if "_" not in text:
         return text
-    first, *others = text.split("_")
-    return "".join([first.lower(), *map(str.title, others)])
+    # "_" is uncased, so title-casing the rest at once matches per-word title().
+    first, _, rest = text.partition("_")
+    return first.lower() + rest.title().replace("_", "")
 
 
 @register_tool(
@@ -129,9 +152,15 @@ def snake_case(text: str) -> str:
     Args:
         text: The string to convert
     """
-    if "_" in text:
+    if "_" in text or not text:
         return text
-    return CASE_PATTERN.sub("_", text).lower()
+    chars = [text[0]]
+    append = chars.append
+    for char in itertools.islice(text, 1, None):
+        if "A" <= char <= "Z":
+            append("_")
+        append(char)
+    return "".join(chars).lower()
 
 
 @register_tool(
@@ -148,7 +177,6 @@ def snake_case(text: str) -> str:
         )
     ],
 )
-@functools.cache
 def format_code(code: str, line_length: int = 100) -> str:
     """Format code to given line length using `black`.
 
@@ -159,6 +187,11 @@ def format_code(code: str, line_length: int = 100) -> str:
     code = code.strip()
     if len(code) < line_length:
         return code
+    return _format_code(code, line_length)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_code(code: str, line_length: int) -> str:
     formatter = utils._get_black_formatter()
     return formatter(code, line_length)
 
@@ -187,17 +220,20 @@ def extract_body(src: str) -> str:
     Args:
         src: Source code to extract the body from
     """
-    lines = src.split("\n")
-    src_lines = itertools.dropwhile(lambda x: x.strip().startswith("@"), lines)
-    line = next(src_lines).strip()  # type: ignore
+    lines = src.splitlines(keepends=True)
+    idx = 0
+    while idx < len(lines) and lines[idx].lstrip().startswith("@"):
+        idx += 1
+    if idx == len(lines):
+        return ""
+    line = lines[idx].strip()
     if not line.startswith(("def ", "class ")):
         return line.rsplit(":")[-1].strip()
-    if not line.endswith(":"):
-        for line in src_lines:
-            line = line.strip()
-            if line.endswith(":"):
-                break
-    return "".join(src_lines)
+    while not lines[idx].rstrip().endswith(":"):
+        idx += 1
+        if idx == len(lines):
+            return ""
+    return "".join(lines[idx + 1 :])
 
 
 @register_tool(
@@ -233,14 +269,7 @@ def format_signature(
         sig = inspect.signature(fn, follow_wrapped=follow_wrapped, eval_str=False)
     if remove_jinja_arg and hasattr(fn, "jinja_pass_arg"):
         # for @pass_xyz decorated functions
-        params = dict(sig._parameters)  # type: ignore[attr-defined]
-        params.pop(next(iter(params)))
-        sig._parameters = params  # type: ignore[attr-defined]
-        # params = dict(sig.parameters)  # Use .parameters instead of ._parameters
-        # if remove_jinja_arg and hasattr(fn, "jinja_pass_arg"):
-        #     params.pop(next(iter(params)))
-        #     sig = sig.replace(parameters=list(params.values()))
-        # return str(sig)
+        sig = sig.replace(parameters=list(sig.parameters.values())[1:])
     return str(sig)
 
 
@@ -258,6 +287,7 @@ def format_signature(
         )
     ],
 )
+@functools.lru_cache(maxsize=2048)
 def format_filter_signature(
     fn: Callable[..., Any],
     filter_name: str,
@@ -299,9 +329,8 @@ def slugify(text: str | os.PathLike[str]) -> str:
     Args:
         text: text to get a slug for
     """
-    text = str(text).lower()
-    text = re.sub("[^0-9a-zA-Z_.]", "_", text)
-    return re.sub("^[^0-9a-zA-Z_#]+", "", text)
+    # After translating, only dots can be left over as leading junk.
+    return str(text).lower().translate(_SLUG_TABLE).lstrip(".")
 
 
 @register_tool(
@@ -345,9 +374,10 @@ def escape(text: str) -> str:
     Args:
         text: text to escape
     """
-    import markupsafe
-
-    return markupsafe.escape(text)
+    if _markup_escape is None:
+        msg = "The escape filter requires the markupsafe package"
+        raise ImportError(msg)
+    return _markup_escape(text)
 
 
 @register_tool(
@@ -363,6 +393,7 @@ def escape(text: str) -> str:
         )
     ],
 )
+@functools.lru_cache(maxsize=8192)
 def format_timestamp(timestamp: float, fmt: str) -> str:
     """Format Unix timestamp to date string.
 
@@ -373,7 +404,9 @@ def format_timestamp(timestamp: float, fmt: str) -> str:
     Returns:
         Formatted date string
     """
-    return datetime.datetime.fromtimestamp(timestamp).strftime(fmt)
+    if any(code in fmt for code in _DATETIME_ONLY_CODES):
+        return datetime.datetime.fromtimestamp(timestamp).strftime(fmt)
+    return time.strftime(fmt, time.localtime(timestamp))
 
 
 if __name__ == "__main__":
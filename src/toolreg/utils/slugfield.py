@@ -13,6 +13,9 @@ if TYPE_CHECKING:
     from pydantic_core import CoreSchema
 
 
+SLUG_PATTERN = r"^[a-zA-Z0-9_]+$"
+
+
 class SlugField:
     """Field type for slug validation."""
 
@@ -22,10 +25,8 @@ class SlugField:
         _source_type: Any,
         _handler: GetCoreSchemaHandler,
     ) -> CoreSchema:
-        return str_schema(
-            pattern=r"^[a-zA-Z0-9_]+$",
-            to_lower=True,
-        )
+        # Copy, pydantic may annotate the schema dict in place.
+        return _SLUG_SCHEMA.copy()
 
     @classmethod
     def __get_pydantic_json_schema__(
@@ -35,11 +36,12 @@ class SlugField:
     ) -> JsonSchemaValue:
         return {
             "type": "string",
-            "pattern": "^[a-zA-Z0-9_]+$",
+            "pattern": SLUG_PATTERN,
             "description": "Slug string (alphanumeric and underscore only)",
         }
 
 
+_SLUG_SCHEMA = str_schema(pattern=SLUG_PATTERN, to_lower=True)
 Slug = Annotated[str, SlugField()]
 
 
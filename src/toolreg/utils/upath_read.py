@@ -3,60 +3,212 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING
+import atexit
+import concurrent.futures
+import functools
+import os
+import pathlib
+import threading
+from typing import TYPE_CHECKING, TypeVar
 
 from upath import UPath
 
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Awaitable, Sequence
 
+    from fsspec import AbstractFileSystem
 
-async def read_paths(paths: Sequence[UPath]) -> dict[UPath, str | bytes]:
+
+T = TypeVar("T")
+
+MAX_CONCURRENT_READS = 256
+# Reads are I/O bound, SSDs keep scaling beyond the default executor size.
+DEFAULT_WORKERS = 64
+_LOCAL_PROTOCOLS = frozenset({"", "file", "local"})
+_local = threading.local()
+
+
+async def read_paths(
+    paths: Sequence[UPath | str | os.PathLike[str]],
+    *,
+    concurrency: int = MAX_CONCURRENT_READS,
+) -> dict[UPath, str | bytes]:
     """Read contents of multiple paths, using async when possible.
 
     Args:
-        paths: Sequence of UPath objects to read
+        paths: Sequence of paths to read (UPaths or anything UPath accepts)
+        concurrency: Maximum number of async reads in flight at the same time
 
     Returns:
         Dictionary mapping paths to their contents
-    """
-    results: dict[UPath, str | bytes] = {}
-    async_tasks: list[asyncio.Task[tuple[UPath, str | bytes]]] = []
-    sync_paths: list[UPath] = []
 
-    # Separate paths into async and sync operations
+    Raises:
+        ValueError: If concurrency is smaller than 1
+    """
+    if concurrency < 1:
+        msg = f"concurrency must be at least 1, got {concurrency}"
+        raise ValueError(msg)
+    if not paths:
+        return {}
+    if len(paths) == 1:
+        # A single local file is read right away, a thread hop would cost more.
+        path = p if isinstance(p := paths[0], UPath) else UPath(p)
+        if path.protocol in _LOCAL_PROTOCOLS and not path.storage_options:
+            return {path: _read_local_text(path.path)}
+    loop = asyncio.get_running_loop()
+    executor = _get_executor()
+    reads: list[Awaitable[str | bytes]] = []
+    pending_paths: list[UPath] = []
+    # Paths of async filesystems bound to this loop get fetched in one batch per fs.
+    batches: dict[AbstractFileSystem, list[UPath]] = {}
+    # Filesystems without storage options only depend on the protocol, so look them
+    # up once per protocol instead of once per path.
+    protocol_fs: dict[str, AbstractFileSystem] = {}
+    upaths = [p if isinstance(p, UPath) else UPath(p) for p in paths]
+    # Large batches could otherwise exhaust the connection pools of remote backends.
+    limit = asyncio.Semaphore(concurrency) if len(upaths) > concurrency else None
     # In the future, we might check if morefs (Async local file system) is installed
-    for path in paths:
-        if path.fs.async_impl:
-            # Create task for async reading
-            task = asyncio.create_task(_read_async(path), name=f"read_{path}")
-            async_tasks.append(task)
+    for path in upaths:
+        protocol, options = path.protocol, path.storage_options
+        if protocol in _LOCAL_PROTOCOLS and not options:
+            # Local files are read directly, no need to resolve a filesystem.
+            reads.append(loop.run_in_executor(executor, _read_local_text, path.path))
+            pending_paths.append(path)
+            continue
+        if options:
+            fs = path.fs
+        elif (fs := protocol_fs.get(protocol)) is None:
+            fs = protocol_fs[protocol] = path.fs
+        if fs.async_impl and fs.asynchronous:
+            batches.setdefault(fs, []).append(path)
+            continue
+        if fs.async_impl:
+            read = _read_async(fs, path)
+            reads.append(read if limit is None else _limited(read, limit))
         else:
-            sync_paths.append(path)
+            reads.append(loop.run_in_executor(executor, fs.read_text, path.path))
+        pending_paths.append(path)
+    if len(reads) == 1 and not batches:
+        return {pending_paths[0]: await reads[0]}
+    # gather wraps the coroutines itself and keeps the input order.
+    if not batches:
+        results: list[str | bytes] = await asyncio.gather(*reads)
+        # pending_paths is in input order here, so the result can be built directly.
+        return dict(zip(pending_paths, results, strict=True))
+    results, *batch_results = await asyncio.gather(
+        asyncio.gather(*reads),
+        *(_read_batch_async(fs, batch, limit) for fs, batch in batches.items()),
+    )
+    contents = dict(zip(pending_paths, results, strict=True))
+    for batch, batch_contents in zip(batches.values(), batch_results, strict=True):
+        contents.update(zip(batch, batch_contents, strict=True))
+    return {path: contents[path] for path in upaths}
+
+
+def read_paths_sync(
+    paths: Sequence[UPath | str | os.PathLike[str]],
+    *,
+    concurrency: int = MAX_CONCURRENT_READS,
+) -> dict[UPath, str | bytes]:
+    """Synchronous version of read_paths.
+
+    Reuses one event loop per thread for all calls instead of creating a new one
+    each time. Must not be called from within a running event loop.
+
+    Args:
+        paths: Sequence of paths to read (UPaths or anything UPath accepts)
+        concurrency: Maximum number of async reads in flight at the same time
+
+    Returns:
+        Dictionary mapping paths to their contents
+    """
+    return _get_runner().run(read_paths(paths, concurrency=concurrency))
 
-    # Handle async reads
-    if async_tasks:
-        async_results = await asyncio.gather(*async_tasks)
-        results.update(dict(async_results))
 
-    # Handle sync reads
-    for path in sync_paths:
-        results[path] = path.read_text()
+def read_bytes(path: UPath) -> bytes:
+    """Read the content of a single path as bytes.
 
-    return results
+    Local files are read via pathlib directly, bypassing the fsspec layer.
+
+    Args:
+        path: UPath object to read
+
+    Returns:
+        The file content
+    """
+    if path.protocol in _LOCAL_PROTOCOLS and not path.storage_options:
+        return pathlib.Path(path.path).read_bytes()
+    return path.read_bytes()
 
 
-async def _read_async(path: UPath) -> tuple[UPath, str | bytes]:
+def _get_runner() -> asyncio.Runner:
+    # A runner must not be shared between threads, so each thread gets its own.
+    if (runner := getattr(_local, "runner", None)) is None:
+        runner = _local.runner = asyncio.Runner()
+        atexit.register(runner.close)
+    return runner
+
+
+@functools.cache
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    workers = int(os.environ.get("UPATH_READ_WORKERS", DEFAULT_WORKERS))
+    executor = concurrent.futures.ThreadPoolExecutor(
+        workers, thread_name_prefix="upath_read"
+    )
+    atexit.register(executor.shutdown, wait=False)
+    return executor
+
+
+async def _read_batch_async(
+    fs: AbstractFileSystem,
+    paths: list[UPath],
+    limit: asyncio.Semaphore | None = None,
+) -> list[str | bytes]:
+    """Read multiple files of one async filesystem concurrently.
+
+    The requests share the session of the filesystem instance.
+
+    Args:
+        fs: The async filesystem the paths belong to
+        paths: UPath objects to read
+        limit: Optional semaphore bounding the number of concurrent reads
+
+    Returns:
+        The file contents, in the order of given paths
+    """
+    if limit is None:
+        return await asyncio.gather(*(fs._cat_file(path.path) for path in paths))
+    return await asyncio.gather(
+        *(_limited(fs._cat_file(path.path), limit) for path in paths)
+    )
+
+
+def _read_local_text(path: str) -> str:
+    """Read a local file directly, skipping the fsspec file wrapper."""
+    return pathlib.Path(path).read_text()
+
+
+async def _limited(awaitable: Awaitable[T], limit: asyncio.Semaphore) -> T:
+    async with limit:
+        return await awaitable
+
+
+async def _read_async(fs: AbstractFileSystem, path: UPath) -> str | bytes:
     """Helper function to read a single file asynchronously.
 
+    Used for async filesystems running on their own event loop thread. The read
+    is scheduled on that loop, so the calling loop is not blocked meanwhile.
+
     Args:
+        fs: The async filesystem the path belongs to
         path: UPath object to read
 
     Returns:
-        Tuple of (path, content)
+        The file content
     """
-    return path, path.fs.cat_file(path.path)
+    future = asyncio.run_coroutine_threadsafe(fs._cat_file(path.path), fs.loop)
+    return await asyncio.wrap_future(future)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from toolreg.tools import inspection
+
+
+def test_list_subclasses_picks_up_new_grandchildren():
+    class A:
+        pass
+
+    class B(A):
+        pass
+
+    assert inspection.list_subclasses(A, filter_locals=False) == [B]
+
+    class C(B):
+        pass
+
+    assert inspection.list_subclasses(A, filter_locals=False) == [B, C]
+    assert list(inspection.iter_subclasses(A, filter_locals=False)) == [B, C]
+    assert inspection.list_subclasses(A, recursive=False, filter_locals=False) == [B]
@@ -9,12 +9,22 @@ def test_reduce_list():
     assert iterate.reduce_list([1, 2, 2, 3, 4, 4, 4, 5]) == [1, 2, 3, 4, 5]
     assert iterate.reduce_list([]) == []
     assert iterate.reduce_list(["a", "b", "b", "c"]) == ["a", "b", "c"]
+    assert iterate.reduce_list([[1], 2, [1], 2]) == [[1], 2]
 
 
 def test_flatten_dict():
     assert iterate.flatten_dict({"a": {"b": {"c": "d"}}}) == {"a/b/c": "d"}
     assert iterate.flatten_dict({"a": {"b": "c"}, "d": "e"}) == {"a/b": "c", "d": "e"}
     assert iterate.flatten_dict({}) == {}
+    nested = {"a": {"b": {"c": 1}, "d": 2}, "e": 3}
+    flat = iterate.flatten_dict(nested, sep=".")
+    assert list(flat.items()) == [("a.b.c", 1), ("a.d", 2), ("e", 3)]
+
+
+def test_chain():
+    assert list(iterate.chain([1, 2], [3])) == [1, 2, 3]
+    assert list(iterate.chain([1, 2, 3])) == [1, 2, 3]
+    assert list(iterate.chain([[1, 2], [3]])) == [[1, 2], [3]]
 
 
 def test_batched():
@@ -48,6 +58,13 @@ def test_do_any():
     assert iterate.do_any([0, 1, 2], attribute="real") is True
 
 
+def test_groupby():
+    data = ["b1", "a1", "b2", "c1", "a2"]
+    grouped = iterate.groupby(data, key=lambda x: x[0])
+    assert grouped == {"a": ["a1", "a2"], "b": ["b1", "b2"], "c": ["c1"]}
+    assert list(grouped) == ["a", "b", "c"]
+
+
 def test_groupby_first_letter():
     data = ["apple", "banana", "cherry", "avocado", "carrot", "blueberry"]
     grouped = iterate.groupby_first_letter(data)
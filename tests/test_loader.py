@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from toolreg.registry import registry
+from toolreg.registry.loader import ToolLoader
+
+
+TOML = """
+[path_basename]
+typ = "filter"
+import_path = "os.path.basename"
+group = "Path"
+
+[broken_tool]
+typ = "filter"
+import_path = "os.path.does_not_exist"
+"""
+
+
+@pytest.fixture
+def items(monkeypatch):
+    items = {}
+    monkeypatch.setattr(registry.ToolRegistry(), "_items", items)
+    return items
+
+
+def test_load_file(tmp_path, items):
+    path = tmp_path / "tools.toml"
+    path.write_text(TOML)
+    ToolLoader().load([str(path)])
+    assert list(items) == ["path_basename"]
+    func, metadata = items["path_basename"]
+    assert func("a/b.txt") == "b.txt"
+    assert metadata.group == "Path"
+
+
+def test_load_directory(tmp_path, items):
+    (tmp_path / "tools" / "sub").mkdir(parents=True)
+    (tmp_path / "tools" / "sub" / "tools.toml").write_text(TOML)
+    invalid = tmp_path / "invalid.toml"
+    invalid.write_text("[unterminated")
+    loader = ToolLoader()
+    loader.load([tmp_path / "tools"], recursive=False)
+    assert items == {}
+    loader.load([invalid, tmp_path / "tools"])
+    assert list(items) == ["path_basename"]
@@ -31,6 +31,12 @@ def test_dig():
     assert serialize.dig(data, "section1", "section2", "nonexistent") is None
 
 
+def test_dig_with_falsy_value():
+    data = {"section1": {"count": 0, "name": ""}}
+    assert serialize.dig(data, "section1", "count") == 0
+    assert serialize.dig(data, "section1", "name") == ""
+
+
 def test_dig_with_list():
     data = {
         "section1": [
@@ -49,8 +49,27 @@ def test_format_signature():
     )
 
 
+def test_extract_body():
+    src = "@deprecated\ndef test(\n    a,\n):\n    b = a\n    return b\n"
+    assert text.extract_body(src) == "    b = a\n    return b\n"
+
+
+def test_lower_camel_case():
+    assert text.lower_camel_case("some_text") == "someText"
+    assert text.lower_camel_case("Some_TEXT_here") == "someTextHere"
+    assert text.lower_camel_case("plain") == "plain"
+
+
+def test_snake_case():
+    assert text.snake_case("someText") == "some_text"
+    assert text.snake_case("SomeText") == "some_text"
+    assert text.snake_case("already_snake") == "already_snake"
+    assert text.snake_case("") == ""
+
+
 def test_slugify():
     assert text.slugify("Hello, World!") == "hello__world_"
+    assert text.slugify("..Über-Path.md") == "_ber_path.md"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from pydantic import ValidationError
+import pytest
+
+from toolreg.registry.tool import Tool
+
+
+def myFunc(value: str) -> str:  # noqa: N802
+    """Return the value unchanged."""
+    return value
+
+
+def test_from_function_validates_metadata():
+    tool = Tool.from_function(myFunc, typ="filter")
+    assert tool.name == "myfunc"
+    assert Tool.model_validate(tool.model_dump()) == tool
+    with pytest.raises(ValidationError):
+        Tool.from_function(myFunc, typ="filter", name="bad name!")
+    with pytest.raises(ValidationError):
+        Tool.from_function(myFunc, typ="bogus")  # type: ignore[arg-type]
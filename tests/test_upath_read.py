@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+
+from fsspec import register_implementation
+from fsspec.asyn import AsyncFileSystem
+import pytest
+from upath import UPath
+
+from toolreg.utils import upath_read
+
+
+class SlowFileSystem(AsyncFileSystem):
+    """Async filesystem stub tracking how many reads are in flight."""
+
+    protocol = "slowtest"
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _cat_file(self, path, start=None, end=None, **kwargs):
+        cls = type(self)
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        await asyncio.sleep(0.01)
+        cls.in_flight -= 1
+        return path.encode()
+
+
+register_implementation("slowtest", SlowFileSystem, clobber=True)
+
+
+def test_read_paths_keeps_input_order(tmp_path):
+    first, second = tmp_path / "a.txt", tmp_path / "b.txt"
+    first.write_text("a")
+    second.write_text("b")
+    memory = UPath("memory:///upath_read/c.txt")
+    memory.write_text("c")
+    paths = [second, memory, str(first)]
+    results = asyncio.run(upath_read.read_paths(paths))
+    assert list(results) == [UPath(second), memory, UPath(first)]
+    assert list(results.values()) == ["b", "c", "a"]
+
+
+def test_read_paths_empty_and_single(tmp_path, monkeypatch):
+    path = tmp_path / "single.txt"
+    path.write_text("content")
+    # Neither case should need the thread pool.
+    monkeypatch.setattr(upath_read, "_get_executor", None)
+    assert asyncio.run(upath_read.read_paths([])) == {}
+    assert asyncio.run(upath_read.read_paths([path])) == {UPath(path): "content"}
+
+
+def test_read_paths_missing_file(tmp_path):
+    existing = tmp_path / "exists.txt"
+    existing.write_text("content")
+    missing = tmp_path / "missing.txt"
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(upath_read.read_paths([missing]))
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(upath_read.read_paths([existing, missing]))
+
+
+def test_read_paths_sync(tmp_path):
+    paths = [tmp_path / f"{i}.txt" for i in range(3)]
+    for i, path in enumerate(paths):
+        path.write_text(str(i))
+    results = upath_read.read_paths_sync(paths)
+    assert list(results.values()) == ["0", "1", "2"]
+    assert upath_read.read_paths_sync(paths[:1]) == {UPath(paths[0]): "0"}
+
+
+@pytest.mark.filterwarnings("ignore:UPath 'slowtest' filesystem")
+@pytest.mark.parametrize("options", [{}, {"asynchronous": True}])
+def test_read_paths_concurrency_limit(options):
+    SlowFileSystem.max_in_flight = 0
+    paths = [UPath(f"slowtest:///{i}", **options) for i in range(10)]
+    results = asyncio.run(upath_read.read_paths(paths, concurrency=3))
+    assert list(results) == paths
+    assert 1 < SlowFileSystem.max_in_flight <= 3  # noqa: PLR2004
+
+
+def test_read_paths_invalid_concurrency(tmp_path):
+    with pytest.raises(ValueError, match="concurrency"):
+        asyncio.run(upath_read.read_paths([tmp_path], concurrency=0))